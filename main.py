@@ -1,9 +1,11 @@
+import argparse
 import logging
-from scraper.page_scraper import PageScraper
+import httpx
 from scraper.video_scraper import VideoScraper
 from scraper.download_manager import DownloadManager
 from scraper.config_manager import ConfigManager
-from scraper.progress_manager import ProgressManager
+from scraper.crawl_scheduler import CrawlScheduler
+from scraper.metadata_index import MetadataIndex
 
 logging.basicConfig(
     level=logging.INFO,
@@ -12,67 +14,86 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scrape video metadata and queue downloads with IDM")
+    parser.add_argument(
+        "--filter",
+        dest="download_filter",
+        help='Only download matching videos, e.g. \'model:"jane doe" AND (category:outdoor OR NOT title:teaser)\''
+    )
+    parser.add_argument(
+        "--download-only",
+        action="store_true",
+        help="Skip scraping and only queue downloads from existing metadata"
+    )
+    return parser.parse_args()
+
+def queue_downloads(download_manager: DownloadManager, download_filter):
+    logger.info("Starting download queue with IDM")
+    stats = download_manager.process_downloads(download_filter)
+    logger.info(f"Download queueing complete: {stats}")
+
 def main():
+    args = parse_args()
     try:
         # Load configuration
         config_manager = ConfigManager("config.json")
         
-        base_url = config_manager.get_base_url()
+        targets = config_manager.get_targets()
         downloads_dir = config_manager.get_downloads_dir()
         timeout = config_manager.get_timeout()
-        pages_per_parse = config_manager.get_pages_per_parse()
-        
-        logger.info(f"Loaded config - URL: {base_url}, Dir: {downloads_dir}, Timeout: {timeout}s, Pages: {pages_per_parse}")
-        
-        # Load progress
-        progress_manager = ProgressManager("progress.json")
-        last_parsed_page = progress_manager.get_last_parsed_page()
-        total_videos = progress_manager.get_total_videos_parsed()
+        max_workers = config_manager.get_max_workers()
+        download_filter = args.download_filter or config_manager.get_download_filter()
         
-        logger.info(f"Previous progress - Last page: {last_parsed_page}, Total videos: {total_videos}")
+        logger.info(f"Loaded config - Targets: {len(targets)}, Dir: {downloads_dir}, Timeout: {timeout}s, Workers: {max_workers}")
+        for target in targets:
+            logger.info(
+                f"Target {target['name']} - URL: {target['url']}, "
+                f"Pages: {target['start_page']}-{target['end_page']}, Per parse: {target['pages_per_parse']}"
+            )
         
-        # Initialize scrapers
-        page_scraper = PageScraper(base_url=base_url, timeout=timeout, pages_per_parse=pages_per_parse)
-        video_scraper = VideoScraper(timeout=timeout, output_dir=downloads_dir)
-        download_manager = DownloadManager(downloads_dir=downloads_dir)
+        # Load metadata index and pick up any records scraped outside of it
+        metadata_index = MetadataIndex(downloads_dir)
+        if metadata_index.sync():
+            metadata_index.save()
         
-        # Determine starting page
-        if last_parsed_page is not None and last_parsed_page > 1:
-            start_page = last_parsed_page - 1
-            logger.info(f"Resuming from page {start_page} (previous: {last_parsed_page})")
-        else:
-            start_page = None  # Will use default starting page
-            logger.info("Starting fresh scrape")
+        if download_filter:
+            # Validate the expression before spending time on scraping
+            metadata_index.query(download_filter)
+            logger.info(f"Download filter: {download_filter}")
         
-        # Scrape video links
-        video_links, last_successful_page = page_scraper.scrape(start_page)
+        download_manager = DownloadManager(downloads_dir=downloads_dir, metadata_index=metadata_index)
         
-        if not video_links:
-            logger.warning("No video links found")
-            if last_successful_page:
-                progress_manager.save_progress(last_successful_page, total_videos)
+        if args.download_only:
+            queue_downloads(download_manager, download_filter)
             return
         
-        logger.info(f"Found {len(video_links)} links, starting scrape")
-        
-        # Scrape individual videos
-        success_count = 0
-        for idx, link in enumerate(video_links, 1):
-            logger.info(f"Processing {idx}/{len(video_links)}: {link}")
-            if video_scraper.scrape_video(link):
-                success_count += 1
+        # Shared connection pool for all crawl targets
+        limits = httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers)
+        with httpx.Client(timeout=timeout, follow_redirects=True, limits=limits) as client:
+            video_scraper = VideoScraper(
+                timeout=timeout,
+                output_dir=downloads_dir,
+                metadata_index=metadata_index,
+                client=client
+            )
+            scheduler = CrawlScheduler(
+                targets=targets,
+                video_scraper=video_scraper,
+                client=client,
+                timeout=timeout,
+                max_workers=max_workers
+            )
+            crawl_stats = scheduler.run()
         
-        logger.info(f"Scraping complete: {success_count}/{len(video_links)} videos")
+        metadata_index.save()
         
-        # Update progress with new totals
-        new_total_videos = total_videos + success_count
-        progress_manager.save_progress(last_successful_page, new_total_videos)
-        logger.info(f"Progress saved - Last page: {last_successful_page}, Total videos: {new_total_videos}")
+        if not any(stats['links'] for stats in crawl_stats.values()):
+            logger.warning("No video links found")
+            return
         
         # Queue downloads with IDM
-        logger.info("Starting download queue with IDM")
-        stats = download_manager.process_downloads()
-        logger.info(f"Download queueing complete: {stats}")
+        queue_downloads(download_manager, download_filter)
             
     except Exception as e:
         logger.error(f"Application error: {e}", exc_info=True)
@@ -1,7 +1,12 @@
 import logging
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+DEFAULT_START_PAGE = 1526
+DEFAULT_END_PAGE = 1
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_PROGRESS_FILE = "progress.json"
 
 class ConfigManager:
     def __init__(self, config_path: str = "config.json"):
@@ -31,14 +36,26 @@ class ConfigManager:
     
     def _validate_config(self, config: Dict[str, Any]):
         try:
-            required_fields = ['base_url', 'downloads_dir', 'timeout', 'pages_per_parse']
+            required_fields = ['downloads_dir', 'timeout']
+            if 'targets' not in config:
+                # Without targets, base_url and pages_per_parse define the single crawl
+                required_fields += ['base_url', 'pages_per_parse']
             
             for field in required_fields:
                 if field not in config:
                     raise ValueError(f"Missing required field: {field}")
             
-            if not isinstance(config['base_url'], str):
-                raise ValueError("base_url must be a string")
+            if 'base_url' in config:
+                if not isinstance(config['base_url'], str):
+                    raise ValueError("base_url must be a string")
+                if not self._has_page_placeholder(config['base_url']):
+                    raise ValueError("base_url must contain a {page} placeholder or a /1/ page segment")
+            
+            if 'targets' in config:
+                self._validate_targets(config['targets'], 'pages_per_parse' in config)
+            
+            if 'max_workers' in config and (not isinstance(config['max_workers'], int) or config['max_workers'] <= 0):
+                raise ValueError("max_workers must be a positive integer")
             
             if not isinstance(config['downloads_dir'], str):
                 raise ValueError("downloads_dir must be a string")
@@ -46,15 +63,91 @@ class ConfigManager:
             if not isinstance(config['timeout'], (int, float)) or config['timeout'] <= 0:
                 raise ValueError("timeout must be a positive number")
             
-            if not isinstance(config['pages_per_parse'], int) or config['pages_per_parse'] <= 0:
+            if 'pages_per_parse' in config and (not isinstance(config['pages_per_parse'], int) or config['pages_per_parse'] <= 0):
                 raise ValueError("pages_per_parse must be a positive integer")
             
+            if config.get('download_filter') is not None and not isinstance(config['download_filter'], str):
+                raise ValueError("download_filter must be a string")
+            
         except Exception as e:
             self.logger.error(f"Config validation failed: {e}", exc_info=True)
             raise
     
-    def get_base_url(self) -> str:
-        return self.config['base_url']
+    def _has_page_placeholder(self, url: str) -> bool:
+        return '{page}' in url or '/1/' in url
+    
+    def _validate_targets(self, targets: Any, has_default_pages_per_parse: bool):
+        if not isinstance(targets, list) or not targets:
+            raise ValueError("targets must be a non-empty list")
+        
+        names = set()
+        progress_files = set()
+        for idx, target in enumerate(targets):
+            if not isinstance(target, dict):
+                raise ValueError(f"targets[{idx}] must be an object")
+            
+            if not isinstance(target.get('url'), str):
+                raise ValueError(f"targets[{idx}].url must be a string")
+            if not self._has_page_placeholder(target['url']):
+                raise ValueError(f"targets[{idx}].url must contain a {{page}} placeholder or a /1/ page segment")
+            
+            name = target.get('name', f"target{idx + 1}")
+            if not isinstance(name, str) or not name:
+                raise ValueError(f"targets[{idx}].name must be a non-empty string")
+            if name in names:
+                raise ValueError(f"Duplicate target name: {name}")
+            names.add(name)
+            
+            for field in ('start_page', 'end_page', 'pages_per_parse'):
+                if field in target and (not isinstance(target[field], int) or target[field] <= 0):
+                    raise ValueError(f"targets[{idx}].{field} must be a positive integer")
+            
+            if 'pages_per_parse' not in target and not has_default_pages_per_parse:
+                raise ValueError(f"targets[{idx}].pages_per_parse is required when no top-level pages_per_parse is set")
+            
+            if target.get('start_page', DEFAULT_START_PAGE) < target.get('end_page', DEFAULT_END_PAGE):
+                raise ValueError(f"targets[{idx}].start_page must not be below end_page")
+            
+            progress_file = target.get('progress_file', f"progress_{name}.json")
+            if not isinstance(progress_file, str):
+                raise ValueError(f"targets[{idx}].progress_file must be a string")
+            if progress_file in progress_files:
+                raise ValueError(f"Duplicate target progress_file: {progress_file}")
+            progress_files.add(progress_file)
+    
+    def get_base_url(self) -> Optional[str]:
+        return self.config.get('base_url')
+    
+    def get_targets(self) -> List[Dict[str, Any]]:
+        """
+        Return crawl targets with defaults filled in.
+        A config with only base_url yields a single target using progress.json.
+        """
+        if 'targets' not in self.config:
+            return [{
+                'name': 'default',
+                'url': self.config['base_url'],
+                'start_page': DEFAULT_START_PAGE,
+                'end_page': DEFAULT_END_PAGE,
+                'pages_per_parse': self.get_pages_per_parse(),
+                'progress_file': DEFAULT_PROGRESS_FILE,
+            }]
+        
+        targets = []
+        for idx, target in enumerate(self.config['targets']):
+            name = target.get('name', f"target{idx + 1}")
+            targets.append({
+                'name': name,
+                'url': target['url'],
+                'start_page': target.get('start_page', DEFAULT_START_PAGE),
+                'end_page': target.get('end_page', DEFAULT_END_PAGE),
+                'pages_per_parse': target['pages_per_parse'] if 'pages_per_parse' in target else self.get_pages_per_parse(),
+                'progress_file': target.get('progress_file', f"progress_{name}.json"),
+            })
+        return targets
+    
+    def get_max_workers(self) -> int:
+        return int(self.config.get('max_workers', DEFAULT_MAX_WORKERS))
     
     def get_downloads_dir(self) -> str:
         return self.config['downloads_dir']
@@ -65,5 +158,8 @@ class ConfigManager:
     def get_pages_per_parse(self) -> int:
         return int(self.config['pages_per_parse'])
     
+    def get_download_filter(self) -> Optional[str]:
+        return self.config.get('download_filter') or None
+    
     def get_all(self) -> Dict[str, Any]:
         return self.config.copy()
\ No newline at end of file
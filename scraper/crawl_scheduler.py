@@ -0,0 +1,247 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from itertools import zip_longest
+from typing import List, Dict, Any, Tuple
+import httpx
+from scraper.page_scraper import PageScraper
+from scraper.video_scraper import VideoScraper
+from scraper.progress_manager import ProgressManager
+
+
+class CrawlScheduler:
+    """
+    Crawl several listing targets in one run.
+
+    Listing pages are submitted round-robin across targets, keeping up to
+    max_workers fetches in flight, and each free worker is refilled as soon as
+    any fetch finishes, so a slow target never holds up the others. A target may
+    prefetch pages ahead of its results; pages are still accepted strictly in
+    order and a target stops at its first failed or empty page, discarding any
+    later pages it had already fetched. The collected video links are then
+    interleaved across targets and deduplicated by URL before scraping, and by
+    video ID before saving.
+    """
+
+    def __init__(
+        self,
+        targets: List[Dict[str, Any]],
+        video_scraper: VideoScraper,
+        client: httpx.Client,
+        timeout: int = 30,
+        max_workers: int = 4
+    ):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.video_scraper = video_scraper
+        self.client = client
+        self.timeout = timeout
+        self.max_workers = max_workers
+        # Video IDs scraped during this run, shared by all targets
+        self.seen_video_ids = set()
+        self.states = [self._init_target(target) for target in targets]
+
+    def _init_target(self, target: Dict[str, Any]) -> Dict[str, Any]:
+        name = target['name']
+        progress_manager = ProgressManager(target['progress_file'])
+        last_parsed_page = progress_manager.get_last_parsed_page()
+
+        # Resume one page past the last parsed one, otherwise start fresh
+        if last_parsed_page is not None and last_parsed_page > target['end_page']:
+            page = min(last_parsed_page - 1, target['start_page'])
+            self.logger.info(f"[{name}] Resuming from page {page} (previous: {last_parsed_page})")
+        else:
+            page = target['start_page']
+            self.logger.info(f"[{name}] Starting fresh scrape from page {page}")
+
+        page_scraper = PageScraper(
+            base_url=target['url'],
+            timeout=self.timeout,
+            pages_per_parse=target['pages_per_parse'],
+            end_page=target['end_page'],
+            client=self.client,
+            name=name
+        )
+
+        return {
+            'target': target,
+            'page_scraper': page_scraper,
+            'progress_manager': progress_manager,
+            'page': page,
+            'next_page': page,
+            'pages_submitted': 0,
+            'pages_parsed': 0,
+            'results': {},
+            'last_successful_page': None,
+            'links': [],
+            'active': True,
+        }
+
+    def _submit_pages(self, executor: ThreadPoolExecutor, pending: Dict[Future, Tuple[Dict[str, Any], int]]):
+        """Fill free workers with the next page of each active target, round-robin."""
+        submitted = True
+        while submitted and len(pending) < self.max_workers:
+            submitted = False
+            for state in self.states:
+                if len(pending) >= self.max_workers:
+                    break
+
+                page_scraper = state['page_scraper']
+                if not state['active'] or not page_scraper.within_bounds(state['next_page'], state['pages_submitted']):
+                    continue
+
+                page = state['next_page']
+                pending[executor.submit(page_scraper.scrape_page, page)] = (state, page)
+                state['next_page'] -= 1
+                state['pages_submitted'] += 1
+                submitted = True
+
+    def _accept_pages(self, state: Dict[str, Any]):
+        """Consume fetched pages in order, stopping the target at the first failure."""
+        name = state['target']['name']
+        page_scraper = state['page_scraper']
+
+        while state['active'] and state['page'] in state['results']:
+            page = state['page']
+            links = state['results'].pop(page)
+
+            if not links:
+                self.logger.warning(f"[{name}] Page {page}: No links found, stopping target")
+                state['active'] = False
+                break
+
+            state['links'].extend(links)
+            state['last_successful_page'] = page
+            state['pages_parsed'] += 1
+            state['page'] -= 1
+
+            pages_per_parse = state['target']['pages_per_parse']
+            self.logger.info(
+                f"[{name}] Page {page}: Found {len(links)} links "
+                f"(Total: {len(state['links'])}, Pages: {state['pages_parsed']}/{pages_per_parse})"
+            )
+
+            if not page_scraper.within_bounds(state['page'], state['pages_parsed']):
+                if state['page'] < state['target']['end_page']:
+                    self.logger.info(f"[{name}] Reached page {state['target']['end_page']}, scraping complete")
+                else:
+                    self.logger.info(f"[{name}] Completed {pages_per_parse} pages for this parse session")
+                state['active'] = False
+
+    def _scrape_pages(self, executor: ThreadPoolExecutor):
+        """Fetch listing pages until every target is exhausted."""
+        pending: Dict[Future, Tuple[Dict[str, Any], int]] = {}
+        self._submit_pages(executor, pending)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                state, page = pending.pop(future)
+                if not state['active']:
+                    # Target already stopped at an earlier page; drop the prefetched result
+                    continue
+
+                try:
+                    links = future.result()
+                except Exception as e:
+                    self.logger.error(f"[{state['target']['name']}] Page {page}: Error - {e}", exc_info=True)
+                    links = []
+
+                state['results'][page] = links
+                self._accept_pages(state)
+
+            self._submit_pages(executor, pending)
+
+    def _interleave_links(self) -> List[Tuple[Dict[str, Any], str]]:
+        """Round-robin links across targets, dropping links already queued by another target."""
+        seen_links = set()
+        queue = []
+        per_target = [[(state, link) for link in state['links']] for state in self.states]
+
+        for batch in zip_longest(*per_target):
+            for item in batch:
+                if item is None:
+                    continue
+                state, link = item
+                if link in seen_links:
+                    continue
+                seen_links.add(link)
+                queue.append(item)
+
+        total_links = sum(len(state['links']) for state in self.states)
+        if total_links > len(queue):
+            self.logger.info(f"Skipped {total_links - len(queue)} duplicate links across targets")
+        return queue
+
+    def _scrape_videos(self, executor: ThreadPoolExecutor) -> Dict[str, int]:
+        """
+        Fetch video pages concurrently, then save them in queue order.
+        A video ID reached through several links is saved and credited once, to
+        the first target in queue order; the duplicate pages are still fetched,
+        since the ID is only known after parsing.
+        """
+        queue = self._interleave_links()
+        success_counts = {state['target']['name']: 0 for state in self.states}
+        if not queue:
+            return success_counts
+
+        self.logger.info(f"Found {len(queue)} unique links, starting scrape")
+        futures = [(state, link, executor.submit(self.video_scraper.fetch_video_data, link)) for state, link in queue]
+
+        for idx, (state, link, future) in enumerate(futures, 1):
+            name = state['target']['name']
+            self.logger.info(f"Processing {idx}/{len(futures)}: {link}")
+            try:
+                data = future.result()
+            except Exception as e:
+                self.logger.error(f"[{name}] Failed scraping {link}: {e}", exc_info=True)
+                continue
+
+            if not data:
+                continue
+
+            if data['video_id'] in self.seen_video_ids:
+                self.logger.info(f"[{name}] Video {data['video_id']}: Already scraped in this run, skipping")
+                continue
+            self.seen_video_ids.add(data['video_id'])
+
+            if self.video_scraper.save_json(data):
+                success_counts[name] += 1
+
+        return success_counts
+
+    def _save_progress(self, success_counts: Dict[str, int]):
+        for state in self.states:
+            name = state['target']['name']
+            if state['last_successful_page'] is None:
+                self.logger.warning(f"[{name}] No pages parsed, progress unchanged")
+                continue
+
+            progress_manager = state['progress_manager']
+            new_total_videos = progress_manager.get_total_videos_parsed() + success_counts[name]
+            progress_manager.save_progress(state['last_successful_page'], new_total_videos)
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Crawl all targets and scrape their videos.
+        Returns: per-target stats with links found and videos scraped
+        """
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                self._scrape_pages(executor)
+                success_counts = self._scrape_videos(executor)
+
+            self._save_progress(success_counts)
+
+            stats = {
+                state['target']['name']: {
+                    'links': len(state['links']),
+                    'scraped': success_counts[state['target']['name']],
+                    'last_page': state['last_successful_page'],
+                }
+                for state in self.states
+            }
+            self.logger.info(f"Crawl complete: {stats}")
+            return stats
+
+        except Exception as e:
+            self.logger.error(f"Crawl failed: {e}", exc_info=True)
+            return {}
@@ -5,11 +5,13 @@ import subprocess
 import time
 from pathlib import Path
 from typing import List, Dict, Optional
+from scraper.metadata_index import MetadataIndex, INDEX_FILENAME
 
 class DownloadManager:
-    def __init__(self, downloads_dir: str):
+    def __init__(self, downloads_dir: str, metadata_index: Optional[MetadataIndex] = None):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.downloads_dir = Path(downloads_dir)
+        self.metadata_index = metadata_index
         self.idm_path = self._find_idm()
         
     def _find_idm(self) -> Optional[str]:
@@ -149,13 +151,34 @@ class DownloadManager:
             self.logger.error(f"Error starting IDM downloads: {e}", exc_info=True)
             return False
     
-    def process_downloads(self) -> Dict[str, int]:
+    def _select_json_files(self, filter_expr: Optional[str]) -> List[Path]:
+        """Return metadata files to process, narrowed by the filter expression if given."""
+        if not filter_expr:
+            return [path for path in self.downloads_dir.rglob("*.json") if path.name != INDEX_FILENAME]
+        
+        if self.metadata_index is None:
+            self.metadata_index = MetadataIndex(str(self.downloads_dir))
+            self.metadata_index.sync()
+        
+        video_ids = self.metadata_index.query(filter_expr)
+        self.logger.info(f"Filter '{filter_expr}' matched {len(video_ids)} videos")
+        
+        json_files = []
+        for video_id in sorted(video_ids):
+            json_path = self.downloads_dir / str(video_id) / f"{video_id}.json"
+            if json_path.exists():
+                json_files.append(json_path)
+            else:
+                self.logger.warning(f"Video {video_id}: Indexed but metadata file missing")
+        return json_files
+    
+    def process_downloads(self, filter_expr: Optional[str] = None) -> Dict[str, int]:
         try:
             if not self.idm_path:
                 self.logger.error("Cannot process downloads: IDM not found")
                 return {'total': 0, 'queued': 0, 'failed': 0}
             
-            json_files = list(self.downloads_dir.rglob("*.json"))
+            json_files = self._select_json_files(filter_expr)
             
             if not json_files:
                 self.logger.warning("No JSON files found")
@@ -0,0 +1,299 @@
+import logging
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+INDEX_FILENAME = "metadata_index.json"
+INDEX_VERSION = 1
+
+FIELDS = ('model', 'category', 'title')
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+_QUERY_TOKEN_RE = re.compile(
+    r'\s*(?:(?P<lparen>\()|(?P<rparen>\))|(?P<term>(?:[A-Za-z]+:)?(?:"[^"]*"|[^\s()"]+)))'
+)
+
+
+def _normalize(value: str) -> str:
+    return ' '.join(value.lower().split())
+
+
+def _title_tokens(title: str) -> List[str]:
+    return _WORD_RE.findall(title.lower())
+
+
+class MetadataIndex:
+    """
+    In-memory inverted index over scraped video metadata.
+
+    Maps 'model:<name>', 'category:<name>' and 'title:<word>' keys to the set
+    of video IDs carrying them. Only the per-video keys are persisted; the
+    postings are rebuilt on load.
+    """
+
+    def __init__(self, downloads_dir: str):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.downloads_dir = Path(downloads_dir)
+        self.index_path = self.downloads_dir / INDEX_FILENAME
+        self.documents: Dict[int, List[str]] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        self._load_index()
+
+    def _load_index(self):
+        try:
+            if not self.index_path.exists():
+                self.logger.info("No metadata index found, starting empty")
+                return
+
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get('version') != INDEX_VERSION:
+                self.logger.warning("Metadata index version mismatch, rebuilding")
+                return
+
+            for video_id, keys in data.get('documents', {}).items():
+                self._add_keys(int(video_id), keys)
+
+            self.logger.info(f"Loaded metadata index: {len(self.documents)} videos, {len(self.postings)} keys")
+
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Invalid JSON in metadata index: {e}", exc_info=True)
+            self.documents, self.postings = {}, {}
+        except Exception as e:
+            self.logger.error(f"Error loading metadata index: {e}", exc_info=True)
+            self.documents, self.postings = {}, {}
+
+    def _keys_for(self, data: Dict) -> List[str]:
+        keys = set()
+        for model in data.get('model', []):
+            if _normalize(model):
+                keys.add(f"model:{_normalize(model)}")
+        for category in data.get('categories', []):
+            if _normalize(category):
+                keys.add(f"category:{_normalize(category)}")
+        for token in _title_tokens(data.get('title', '')):
+            keys.add(f"title:{token}")
+        return sorted(keys)
+
+    def _add_keys(self, video_id: int, keys: Iterable[str]):
+        self.documents[video_id] = list(keys)
+        for key in self.documents[video_id]:
+            self.postings.setdefault(key, set()).add(video_id)
+
+    def _remove(self, video_id: int):
+        for key in self.documents.pop(video_id, []):
+            ids = self.postings.get(key)
+            if ids is None:
+                continue
+            ids.discard(video_id)
+            if not ids:
+                del self.postings[key]
+
+    def add_record(self, data: Dict) -> bool:
+        """Index (or re-index) a single scraped video record."""
+        try:
+            video_id = data.get('video_id')
+            if not video_id:
+                self.logger.warning("Cannot index record without video_id")
+                return False
+
+            video_id = int(video_id)
+            self._remove(video_id)
+            self._add_keys(video_id, self._keys_for(data))
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error indexing record: {e}", exc_info=True)
+            return False
+
+    def sync(self) -> int:
+        """
+        Bring the index in line with the metadata files on disk.
+
+        New records and records modified since the index was last saved are
+        (re)indexed, and records whose file is gone are dropped. Unreadable
+        files are logged and skipped. Returns the number of changed videos.
+        """
+        indexed = 0
+        removed = 0
+        try:
+            index_mtime = self.index_path.stat().st_mtime if self.index_path.exists() else None
+            on_disk = set()
+
+            for json_path in self.downloads_dir.glob("*/*.json"):
+                try:
+                    video_id = int(json_path.parent.name)
+                except ValueError:
+                    continue
+                on_disk.add(video_id)
+
+                try:
+                    if (
+                        video_id in self.documents
+                        and index_mtime is not None
+                        and json_path.stat().st_mtime <= index_mtime
+                    ):
+                        continue
+
+                    with open(json_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    data.setdefault('video_id', video_id)
+
+                    if self.add_record(data):
+                        indexed += 1
+
+                except Exception as e:
+                    self.logger.error(f"Error indexing {json_path}: {e}")
+                    continue
+
+            for video_id in [video_id for video_id in self.documents if video_id not in on_disk]:
+                self._remove(video_id)
+                removed += 1
+
+            if indexed or removed:
+                self.logger.info(f"Indexed {indexed} videos, removed {removed} (Total: {len(self.documents)})")
+            return indexed + removed
+
+        except Exception as e:
+            self.logger.error(f"Error syncing metadata index: {e}", exc_info=True)
+            return indexed + removed
+
+    def save(self) -> bool:
+        try:
+            self.downloads_dir.mkdir(parents=True, exist_ok=True)
+            data = {
+                'version': INDEX_VERSION,
+                'documents': {str(video_id): keys for video_id, keys in sorted(self.documents.items())},
+            }
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+
+            self.logger.info(f"Metadata index saved: {len(self.documents)} videos")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error saving metadata index: {e}", exc_info=True)
+            return False
+
+    def query(self, expression: str) -> Set[int]:
+        """
+        Evaluate a boolean filter expression and return matching video IDs.
+
+        Terms are 'model:<name>', 'category:<name>', 'title:<word>' or a bare
+        word (matched against the title). Quote values containing spaces, e.g.
+        model:"jane doe". Terms combine with AND, OR, NOT (any case) and
+        parentheses; adjacent terms are implicitly ANDed. Quote a bare word to
+        search for an operator word in titles, e.g. "or". Raises ValueError on
+        bad syntax.
+        """
+        tokens = self._tokenize(expression)
+        if not tokens:
+            return set(self.documents)
+
+        return _QueryParser(self, tokens).parse()
+
+    def _tokenize(self, expression: str) -> List[tuple]:
+        tokens = []
+        pos = 0
+        expression = expression.strip()
+        while pos < len(expression):
+            match = _QUERY_TOKEN_RE.match(expression, pos)
+            if not match or match.end() == pos:
+                raise ValueError(f"Invalid filter syntax near: {expression[pos:]}")
+            pos = match.end()
+            if match.group('lparen'):
+                tokens.append(('(', '('))
+            elif match.group('rparen'):
+                tokens.append((')', ')'))
+            else:
+                term = match.group('term')
+                if term.upper() in ('AND', 'OR', 'NOT'):
+                    tokens.append((term.upper(), term))
+                else:
+                    tokens.append(('TERM', term))
+        return tokens
+
+    def _lookup(self, term: str) -> Set[int]:
+        field, sep, value = term.partition(':')
+        if not sep:
+            field, value = 'title', term
+        field = field.lower()
+        if field == 'categories':
+            field = 'category'
+        if field == 'models':
+            field = 'model'
+        if field not in FIELDS:
+            raise ValueError(f"Unknown filter field: {field} (expected one of {', '.join(FIELDS)})")
+
+        value = value.strip('"')
+        if field == 'title':
+            words = _title_tokens(value)
+            if not words:
+                return set()
+            result = set(self.postings.get(f"title:{words[0]}", set()))
+            for word in words[1:]:
+                result &= self.postings.get(f"title:{word}", set())
+            return result
+
+        return set(self.postings.get(f"{field}:{_normalize(value)}", set()))
+
+
+class _QueryParser:
+    """Recursive-descent evaluator for a single tokenized filter expression."""
+
+    def __init__(self, index: MetadataIndex, tokens: List[tuple]):
+        self.index = index
+        self.tokens = tokens
+        self.pos = 0
+
+    def parse(self) -> Set[int]:
+        result = self._parse_or()
+        if self.pos < len(self.tokens):
+            raise ValueError(f"Unexpected token in filter: {self.tokens[self.pos][1]}")
+        return result
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def _parse_or(self) -> Set[int]:
+        result = self._parse_and()
+        while self._peek() == 'OR':
+            self.pos += 1
+            result = result | self._parse_and()
+        return result
+
+    def _parse_and(self) -> Set[int]:
+        result = self._parse_not()
+        while self._peek() in ('AND', 'NOT', 'TERM', '('):
+            if self._peek() == 'AND':
+                self.pos += 1
+            result = result & self._parse_not()
+        return result
+
+    def _parse_not(self) -> Set[int]:
+        if self._peek() == 'NOT':
+            self.pos += 1
+            return set(self.index.documents) - self._parse_not()
+        return self._parse_atom()
+
+    def _parse_atom(self) -> Set[int]:
+        kind = self._peek()
+        if kind is None:
+            raise ValueError("Unexpected end of filter expression")
+
+        if kind == '(':
+            self.pos += 1
+            result = self._parse_or()
+            if self._peek() != ')':
+                raise ValueError("Missing closing parenthesis in filter")
+            self.pos += 1
+            return result
+
+        if kind == 'TERM':
+            term = self.tokens[self.pos][1]
+            self.pos += 1
+            return self.index._lookup(term)
+
+        raise ValueError(f"Unexpected token in filter: {self.tokens[self.pos][1]}")
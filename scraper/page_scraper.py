@@ -1,7 +1,8 @@
 import logging
-from typing import List, Optional, Tuple
+from typing import List, Optional
 import httpx
 from selectolax.parser import HTMLParser
+from scraper.config_manager import DEFAULT_END_PAGE
 
 logging.basicConfig(
     level=logging.INFO,
@@ -9,20 +10,41 @@ logging.basicConfig(
 )
 
 class PageScraper:
-    def __init__(self, base_url: str, timeout: int = 30, pages_per_parse: int = 10):
-        self.logger = logging.getLogger(self.__class__.__name__)
-        self.base_url_template = base_url.replace('/1/', '/{}/')
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        pages_per_parse: int = 10,
+        end_page: int = DEFAULT_END_PAGE,
+        client: Optional[httpx.Client] = None,
+        name: Optional[str] = None
+    ):
+        self.logger = logging.getLogger(f"{self.__class__.__name__}.{name}" if name else self.__class__.__name__)
+        self.base_url_template = self._build_url_template(base_url)
         self.timeout = timeout
         self.pages_per_parse = pages_per_parse
+        self.end_page = end_page
+        self.client = client
+    
+    def _build_url_template(self, base_url: str) -> str:
+        """Use an explicit {page} placeholder if present, otherwise the /1/ path segment."""
+        if '{page}' in base_url:
+            return base_url.replace('{page}', '{}')
+        return base_url.replace('/1/', '/{}/')
+    
+    def _get(self, url: str) -> httpx.Response:
+        if self.client is not None:
+            return self.client.get(url)
+        with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
+            return client.get(url)
         
     def fetch_html(self, page: int) -> Optional[str]:
         try:
             url = self.base_url_template.format(page)
-            with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                self.logger.info(f"Page {page}: Fetched {len(response.text)} bytes")
-                return response.text
+            response = self._get(url)
+            response.raise_for_status()
+            self.logger.info(f"Page {page}: Fetched {len(response.text)} bytes")
+            return response.text
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 self.logger.info(f"Page {page}: 404 - Page not found")
@@ -55,53 +77,16 @@ class PageScraper:
             self.logger.error(f"Error parsing HTML: {e}", exc_info=True)
             return []
     
-    def scrape(self, start_page: Optional[int] = None) -> Tuple[List[str], int]:
+    def scrape_page(self, page: int) -> List[str]:
+        """Fetch and parse a single listing page. Returns an empty list on failure."""
+        html = self.fetch_html(page)
+        if not html:
+            return []
+        return self.parse_video_links(html)
+    
+    def within_bounds(self, page: int, pages_parsed: int) -> bool:
         """
-        Scrape video links in reverse order (decrementing page numbers).
-        Returns: (list of video links, last successfully parsed page)
+        Whether page should still be scraped in this parse session.
+        Pages are scraped in reverse order (decrementing page numbers) down to end_page.
         """
-        try:
-            # If start_page is provided, use it; otherwise start from default
-            if start_page is None:
-                page = 1526
-                self.logger.info(f"Starting from default page: {page}")
-            else:
-                page = start_page
-                self.logger.info(f"Resuming from page: {page}")
-            
-            all_links = []
-            pages_parsed = 0
-            last_successful_page = page
-            
-            while page >= 1 and pages_parsed < self.pages_per_parse:
-                self.logger.info(f"Scraping page {page} (Progress: {pages_parsed + 1}/{self.pages_per_parse})")
-                html = self.fetch_html(page)
-                
-                if not html:
-                    self.logger.warning(f"Page {page}: Failed to fetch, stopping")
-                    break
-                
-                links = self.parse_video_links(html)
-                if not links:
-                    self.logger.warning(f"Page {page}: No links found, stopping")
-                    break
-                
-                all_links.extend(links)
-                last_successful_page = page
-                pages_parsed += 1
-                
-                self.logger.info(f"Page {page}: Found {len(links)} links (Total: {len(all_links)}, Pages: {pages_parsed}/{self.pages_per_parse})")
-                
-                # Move to previous page
-                page -= 1
-            
-            if page < 1:
-                self.logger.info("Reached page 1, scraping complete")
-            elif pages_parsed >= self.pages_per_parse:
-                self.logger.info(f"Completed {self.pages_per_parse} pages for this parse session")
-            
-            return all_links, last_successful_page
-            
-        except Exception as e:
-            self.logger.error(f"Scraping failed: {e}", exc_info=True)
-            return [], last_successful_page if 'last_successful_page' in locals() else (start_page or 1526)
\ No newline at end of file
+        return page >= self.end_page and pages_parsed < self.pages_per_parse
@@ -5,13 +5,22 @@ from pathlib import Path
 from typing import Optional, Dict, List
 import httpx
 from selectolax.parser import HTMLParser
+from scraper.metadata_index import MetadataIndex
 
 
 class VideoScraper:
-    def __init__(self, timeout: int, output_dir: str):
+    def __init__(
+        self,
+        timeout: int,
+        output_dir: str,
+        metadata_index: Optional[MetadataIndex] = None,
+        client: Optional[httpx.Client] = None
+    ):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.timeout = timeout
         self.output_dir = Path(output_dir)
+        self.metadata_index = metadata_index
+        self.client = client
         self._ensure_output_dir()
 
     def _ensure_output_dir(self):
@@ -23,10 +32,13 @@ class VideoScraper:
 
     def fetch_html(self, url: str) -> Optional[str]:
         try:
-            with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                return response.text
+            if self.client is not None:
+                response = self.client.get(url)
+            else:
+                with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
+                    response = client.get(url)
+            response.raise_for_status()
+            return response.text
         except httpx.TimeoutException as e:
             self.logger.error(f"Timeout fetching {url}: {e}")
             return None
@@ -133,25 +145,36 @@ class VideoScraper:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             
             self.logger.info(f"Saved {video_id}/{video_id}.json")
+
+            if self.metadata_index is not None:
+                self.metadata_index.add_record(data)
+
             return True
 
         except Exception as e:
             self.logger.error(f"Error saving JSON: {e}", exc_info=True)
             return False
 
-    def scrape_video(self, url: str) -> bool:
+    def fetch_video_data(self, url: str) -> Optional[Dict]:
+        """Fetch a video page and extract its metadata without saving it."""
         try:
             html = self.fetch_html(url)
             if not html:
-                return False
+                return None
 
             data = self.extract_video_data(html)
             if not data:
                 self.logger.warning(f"No data extracted from {url}")
-                return False
+                return None
 
-            return self.save_json(data)
+            return data
 
         except Exception as e:
             self.logger.error(f"Failed scraping {url}: {e}", exc_info=True)
+            return None
+
+    def scrape_video(self, url: str) -> bool:
+        data = self.fetch_video_data(url)
+        if not data:
             return False
+        return self.save_json(data)